@@ -248,7 +248,8 @@ class UserList(ListAPIView):
     """
     API view class to view/list the Users.
     """
-    queryset = CustomUser.objects.all()
+    # the serializer lists the groups and the permissions of every user, they are fetched with one query each
+    queryset = CustomUser.objects.prefetch_related('groups', 'user_permissions')
     serializer_class = CustomUserSerializer
     filter_backends = (DjangoFilterBackend, SearchFilter)
     filter_fields = ('id', 'is_active')
@@ -264,7 +265,7 @@ class UserList(ListAPIView):
         active = self.request.query_params.get('active', None)
         if active is None:
             return super().get_queryset()
-        queryset = CustomUser.objects.all()
+        queryset = super().get_queryset()
         if active.lower() == 'false':
             return queryset.filter(Q(is_active=False))
         return queryset.filter(Q(is_active=True))
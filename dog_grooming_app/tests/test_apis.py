@@ -1,331 +1,354 @@
 import os
 import datetime
-from rest_framework.test import APITestCase
-from rest_framework.test import APIClient
+from rest_framework.test import APITestCase, APIRequestFactory, force_authenticate
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from django.urls import reverse
 from django.conf import settings
+from django.test import tag
+from django.contrib.auth.hashers import make_password
+from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import Mock, patch
 
 from dog_grooming_app.models import CustomUser, Contact, Service, Booking
 from dog_grooming_app.api_views import CancelUser, CancelBooking, ListAvailableBookingSlots, \
-    ServiceRetrieveUpdateDestroy
+    ContactCreate, ServiceCreate, ServiceList, ServiceRetrieveUpdateDestroy, BookingCreate, BookingList, UserList
+
+
+# the default service photo, read only once, each upload gets its own in-memory file from these bytes
+with open(os.path.join(settings.MEDIA_ROOT, 'services', 'default.jpg'), 'rb') as _photo_data:
+    _DEFAULT_PHOTO_BYTES = _photo_data.read()
+_PAST_DATE = datetime.date(2000, 1, 1)
+_DEFAULT_CONTACT_ATTRS = {
+    'phone_number': '+36991234567',
+    'email': 'somebody@mail.com',
+    'address': 'Happiness Street 1, HappyCity, 99999',
+    'opening_hour_monday': '08:00:00',
+    'closing_hour_monday': '17:30:00',
+    'opening_hour_tuesday': '08:00:00',
+    'closing_hour_tuesday': '17:30:00',
+    'opening_hour_wednesday': '08:00:00',
+    'closing_hour_wednesday': '17:30:00',
+    'opening_hour_thursday': '08:00:00',
+    'closing_hour_thursday': '17:30:00',
+    'opening_hour_friday': '08:00:00',
+    'closing_hour_friday': '17:30:00',
+    'opening_hour_saturday': '09:00:00',
+    'closing_hour_saturday': '13:30:00',
+    'google_maps_url': 'https://www.google.com/maps/embed?pb=!1m18!1m12!1m3!1d2726.2653641484812!2d19.65391067680947!3d46.89749933667435!2m3!1f0!2f0!3f0!3m2!1i1024!2i768!4f13.1!3m3!1m2!1s0x4743d09cb06aa0cd%3A0xc162d3291067ef90!2sBennett%20Kft.%20Sz%C3%A9kt%C3%B3i%20kutyaszalon!5e0!3m2!1sen!2ses!4v1696190559457!5m2!1sen!2ses'
+}
+
+# the URLs of the APIs without arguments, reversed only once for all the tests
+_URL_API_CONTACT_CREATE = reverse('api_contact_create')
+_URL_API_SERVICE_CREATE = reverse('api_service_create')
+_URL_API_SERVICES = reverse('api_services')
+_URL_API_BOOKING_CREATE = reverse('api_booking_create')
+_URL_API_BOOKINGS = reverse('api_bookings')
+_URL_API_AVAILABLE_BOOKING_SLOTS = reverse('api_available_booking_slots')
+_URL_API_USERS = reverse('api_users')
+
+
+class _AuthenticationMixin:
+    """
+    Forces the authentication of the API client only when the authenticated user changes.
+    """
+
+    def _auth(self, user):
+        """Authenticates the given user unless they are authenticated already."""
+        if getattr(self, '_current_auth', None) is not user:
+            self.client.force_authenticate(user=user)
+            self._current_auth = user
 
+    def _call_view(self, view_class, method='get', data=None, **kwargs):
+        """
+        Calls the API view directly as the regular user, skipping the URL resolution and the middlewares.
+        It is enough for the tests that only check the permissions of the view.
+        """
+        request = getattr(APIRequestFactory(), method)('/', data)
+        force_authenticate(request, user=self.user)
+        return view_class.as_view()(request, **kwargs)
 
-class ContactAPITestCase(APITestCase):
+
+@tag('api', 'contact')
+class ContactAPITestCase(_AuthenticationMixin, APITestCase):
     """
     Test cases for APIs related to contact details.
     """
+    _CONTACT_UPDATE_ATTRS_TEMPLATE = {
+        'email': 'somebody@newmail.com'
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
+        cls.user = CustomUser.objects.create_user(username='user', password='test_password')
+        # counted once, the tests compare against it after creating or deleting the contact
+        cls.initial_contact_count = Contact.objects.count()
 
     def setUp(self):
-        self.client = APIClient()
-        self.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
-        self.user = CustomUser.objects.create_user(username='user', password='test_password')
-        self.contact_attrs = {
-            'phone_number': '+36991234567',
-            'email': 'somebody@mail.com',
-            'address': 'Happiness Street 1, HappyCity, 99999',
-            'opening_hour_monday': '08:00:00',
-            'closing_hour_monday': '17:30:00',
-            'opening_hour_tuesday': '08:00:00',
-            'closing_hour_tuesday': '17:30:00',
-            'opening_hour_wednesday': '08:00:00',
-            'closing_hour_wednesday': '17:30:00',
-            'opening_hour_thursday': '08:00:00',
-            'closing_hour_thursday': '17:30:00',
-            'opening_hour_friday': '08:00:00',
-            'closing_hour_friday': '17:30:00',
-            'opening_hour_saturday': '09:00:00',
-            'closing_hour_saturday': '13:30:00',
-            'google_maps_url': 'https://www.google.com/maps/embed?pb=!1m18!1m12!1m3!1d2726.2653641484812!2d19.65391067680947!3d46.89749933667435!2m3!1f0!2f0!3f0!3m2!1i1024!2i768!4f13.1!3m3!1m2!1s0x4743d09cb06aa0cd%3A0xc162d3291067ef90!2sBennett%20Kft.%20Sz%C3%A9kt%C3%B3i%20kutyaszalon!5e0!3m2!1sen!2ses!4v1696190559457!5m2!1sen!2ses'
-        }
-        self.contact_update_attrs = {
-            'email': 'somebody@newmail.com'
-        }
+        # the tests mutate the attrs, so every test gets its own copy of the templates
+        self.contact_attrs = _DEFAULT_CONTACT_ATTRS.copy()
+        self.contact_update_attrs = self._CONTACT_UPDATE_ATTRS_TEMPLATE.copy()
 
-    def _send_create_request(self, admin=True):
+    def _send_create_request(self):
         """Calls the API to create the contact details."""
-        self.client.force_authenticate(user=self.admin_user if admin else self.user)
-        return self.client.post(reverse('api_contact_create'), self.contact_attrs)
+        self._auth(self.admin_user)
+        return self.client.post(_URL_API_CONTACT_CREATE, self.contact_attrs)
 
     def test_01_create_contact_without_permission(self):
         """Tries to create contact details without permission."""
-        response = self._send_create_request(admin=False)
+        response = self._call_view(ContactCreate, 'post', self.contact_attrs)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_02_create_contact(self):
         """Tests creating the contact details."""
-        initial_count = Contact.objects.count()
         response = self._send_create_request()
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Contact.objects.count(), initial_count + 1)
+        self.assertEqual(Contact.objects.count(), self.initial_contact_count + 1)
         for attr, expected_value in self.contact_attrs.items():
             self.assertEqual(response.data[attr], expected_value)
 
-    def test_03_update_contact_without_permission(self):
-        """Tries to update contact details without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        contact = Contact.objects.first()
-        response = self.client.patch(reverse('api_contact_update_delete', args=(contact.id,)),
-                                     self.contact_update_attrs,
-                                     format='json')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_04_update_contact(self):
-        """Tests updating the contact details."""
-        self._send_create_request()
-        contact = Contact.objects.first()
-        self.client.patch(reverse('api_contact_update_delete', args=(contact.id,)), self.contact_update_attrs,
-                          format='json')
-        updated = Contact.objects.get(id=contact.id)
-        self.assertEqual(updated.email, 'somebody@newmail.com')
-
-    def test_05_delete_contact_without_permission(self):
-        """Tries to delete contact details without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        contact = Contact.objects.first()
-        response = self.client.delete(reverse('api_contact_update_delete', args=(contact.id,)))
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_06_delete_contact(self):
-        """Tests deleting the contact details."""
-        self._send_create_request()
-        initial_count = Contact.objects.count()
-        contact = Contact.objects.first()
-        self.client.delete(reverse('api_contact_update_delete', args=(contact.id,)))
-        self.assertEqual(Contact.objects.count(), initial_count - 1)
-        self.assertRaises(Contact.DoesNotExist, Contact.objects.get, id=contact.id)
-
-    def test_07_cannot_create_multiple(self):
+    def test_03_update_and_delete_contact(self):
+        """Tests updating and deleting the contact details, with and without permission."""
+        contact = Contact.objects.create(**self.contact_attrs)
+        url = reverse('api_contact_update_delete', args=(contact.id,))
+        with self.subTest('update without permission'):
+            self._auth(self.user)
+            response = self.client.patch(url, self.contact_update_attrs, format='json')
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with self.subTest('update'):
+            self._auth(self.admin_user)
+            self.client.patch(url, self.contact_update_attrs, format='json')
+            updated = Contact.objects.get(id=contact.id)
+            self.assertEqual(updated.email, 'somebody@newmail.com')
+        with self.subTest('delete without permission'):
+            self._auth(self.user)
+            response = self.client.delete(url)
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with self.subTest('delete'):
+            self._auth(self.admin_user)
+            self.client.delete(url)
+            self.assertEqual(Contact.objects.count(), self.initial_contact_count)
+            self.assertRaises(Contact.DoesNotExist, Contact.objects.get, id=contact.id)
+
+    def test_04_cannot_create_multiple(self):
         """Tries to create multiple contact records."""
-        self._send_create_request()
+        Contact.objects.create(**self.contact_attrs)
         response = self._send_create_request()
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class ServiceAPITestCase(APITestCase):
+@tag('api', 'service', 'slow')
+class ServiceAPITestCase(_AuthenticationMixin, APITestCase):
     """
     Test cases for APIs related to services.
     """
+    _SERVICE_ATTRS_TEMPLATE = {
+        'service_name_en': 'Service name EN',
+        'service_name_hu': 'Service name HU',
+        'price_default': 1000,
+        'price_small': 750,
+        'price_big': 1250,
+        'service_description_en': 'Description in English for the service.',
+        'service_description_hu': 'A szolgáltatás leírása magyarul.',
+        'max_duration': 60,
+        'active': True
+    }
+    _SERVICE_UPDATE_ATTRS_TEMPLATE = {
+        'service_name_en': 'Service name EN changed',
+        'service_name_hu': 'Service name HU valtozott',
+        'price_default': 1050
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
+        cls.user = CustomUser.objects.create_user(username='user', password='test_password')
+        # counted once, the tests compare against it after creating or deleting a service
+        cls.initial_service_count = Service.objects.count()
 
     def setUp(self):
-        self.client = APIClient()
-        self.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
-        self.user = CustomUser.objects.create_user(username='user', password='test_password')
-        self.service_attrs = {
-            'service_name_en': 'Service name EN',
-            'service_name_hu': 'Service name HU',
-            'price_default': 1000,
-            'price_small': 750,
-            'price_big': 1250,
-            'service_description_en': 'Description in English for the service.',
-            'service_description_hu': 'A szolgáltatás leírása magyarul.',
-            'max_duration': 60,
-            'active': True
-        }
-        self.photo_path = os.path.join(settings.MEDIA_ROOT, 'services', 'default.jpg')
-        self.service_update_attrs = {
-            'service_name_en': 'Service name EN changed',
-            'service_name_hu': 'Service name HU valtozott',
-            'price_default': 1050
-        }
-
-    def _send_create_request(self, admin=True):
-        """Calls the API to create a new service. It uploads a photo too as it is required.
-        At the end the photo is deleted."""
-        self.client.force_authenticate(user=self.admin_user if admin else self.user)
-        with open(self.photo_path, 'rb') as photo_data:
-            self.service_attrs['photo'] = photo_data
-            self.service_attrs['service_name_en'] = 'Service name EN {}'.format(Service.objects.count())
-            response = self.client.post(reverse('api_service_create'), self.service_attrs, format='multipart')
-        if admin:
-            try:
-                created_service = Service.objects.last()
-                os.remove(created_service.photo.path)
-            except:
-                pass
-        return response
+        # the tests mutate the attrs, so every test gets its own copy of the templates
+        self.service_attrs = self._SERVICE_ATTRS_TEMPLATE.copy()
+        self.service_update_attrs = self._SERVICE_UPDATE_ATTRS_TEMPLATE.copy()
+
+    def _send_create_request(self):
+        """Calls the API to create a new service. It uploads a photo too as it is required."""
+        self._auth(self.admin_user)
+        self.service_attrs['photo'] = SimpleUploadedFile('default.jpg', _DEFAULT_PHOTO_BYTES, content_type='image/jpeg')
+        self.service_attrs['service_name_en'] = 'Service name EN {}'.format(Service.objects.count())
+        return self.client.post(_URL_API_SERVICE_CREATE, self.service_attrs, format='multipart')
+
+    def _create_services(self, active_count=1, inactive_count=0):
+        """
+        Creates active and inactive services directly in the database, for the tests that do not test the creation
+        itself. They are saved one by one, so their prices are validated and their slugs are generated like for any
+        other service. The default photo is referenced, so no file is uploaded.
+        """
+        return [Service.objects.create(**{**self._SERVICE_ATTRS_TEMPLATE,
+                                          'service_name_en': 'Service name EN {}'.format(i),
+                                          'photo': 'services/default.jpg',
+                                          'active': i < active_count})
+                for i in range(active_count + inactive_count)]
 
     def test_01_create_service_without_permission(self):
         """Tries to create a service without permission."""
-        response = self._send_create_request(admin=False)
+        response = self._call_view(ServiceCreate, 'post', self.service_attrs)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_02_create_service(self):
         """Tests creating a service."""
-        initial_count = Service.objects.count()
         response = self._send_create_request()
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Service.objects.count(), initial_count + 1)
+        self.assertEqual(Service.objects.count(), self.initial_service_count + 1)
         for attr, expected_value in self.service_attrs.items():
             if attr != 'photo':
                 self.assertEqual(response.data[attr], expected_value)
 
-    def test_03_update_service_without_permission(self):
-        """Tries to update a service without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        service = Service.objects.first()
-        response = self.client.patch(reverse('api_service_update_delete', args=(service.id,)),
-                                     self.service_update_attrs,
-                                     format='json')
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_04_update_service(self):
-        """Tests updating a service."""
-        self._send_create_request()
-        service = Service.objects.first()
-        original_photo = service.photo
-        self.client.patch(reverse('api_service_update_delete', args=(service.id,)), self.service_update_attrs,
-                          format='json')
-        updated = Service.objects.get(id=service.id)
-        self.assertEqual(updated.service_name_en, 'Service name EN changed')
-        self.assertEqual(updated.service_name_hu, 'Service name HU valtozott')
-        self.assertEqual(updated.price_default, 1050)
-        # to validate that even if we didn't provide any photo in the update, it remained the same
-        self.assertEqual(original_photo, updated.photo)
-
-    def test_05_delete_service_without_permission(self):
-        """Tries to delete a service without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        service = Service.objects.first()
-        response = self.client.delete(reverse('api_service_update_delete', args=(service.id,)))
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-    def test_06_delete_service(self):
-        """Tests deleting a service."""
-        self._send_create_request()
-        initial_count = Service.objects.count()
-        service = Service.objects.first()
-        self.client.delete(reverse('api_service_update_delete', args=(service.id,)))
-        self.assertEqual(Service.objects.count(), initial_count - 1)
-        self.assertRaises(Service.DoesNotExist, Service.objects.get, id=service.id)
-
-    def test_07_list_services_without_permission(self):
+    def test_03_update_and_delete_service(self):
+        """Tests updating and deleting a service, with and without permission."""
+        service = self._create_services()[0]
+        url = reverse('api_service_update_delete', args=(service.id,))
+        with self.subTest('update without permission'):
+            self._auth(self.user)
+            response = self.client.patch(url, self.service_update_attrs, format='json')
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with self.subTest('update'):
+            self._auth(self.admin_user)
+            self.client.patch(url, self.service_update_attrs, format='json')
+            updated = Service.objects.get(id=service.id)
+            self.assertEqual(updated.service_name_en, 'Service name EN changed')
+            self.assertEqual(updated.service_name_hu, 'Service name HU valtozott')
+            self.assertEqual(updated.price_default, 1050)
+            # to validate that even if we didn't provide any photo in the update, it remained the same
+            self.assertEqual(service.photo, updated.photo)
+        with self.subTest('delete without permission'):
+            self._auth(self.user)
+            response = self.client.delete(url)
+            self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        with self.subTest('delete'):
+            self._auth(self.admin_user)
+            self.client.delete(url)
+            self.assertEqual(Service.objects.count(), self.initial_service_count)
+            self.assertRaises(Service.DoesNotExist, Service.objects.get, id=service.id)
+
+    def test_04_list_services_without_permission(self):
         """Tries to list the services (using the API) without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(reverse('api_services'))
+        response = self._call_view(ServiceList)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    def test_08_list_all_services(self):
+    def test_05_list_all_services(self):
         """Tests listing all the services, using the API."""
-        self.service_attrs['active'] = True
-        self._send_create_request()
-        self.service_attrs['active'] = False
-        self._send_create_request()
+        self._create_services(active_count=1, inactive_count=1)
+        self._auth(self.admin_user)
         services_count = Service.objects.count()
-        response = self.client.get(reverse('api_services'))
+        # one query counts the records and one fetches the page, however many records there are
+        with self.assertNumQueries(2):
+            response = self.client.get(_URL_API_SERVICES)
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(response.data['count'], services_count)
         self.assertEqual(len(response.data['results']), services_count)
 
-    def test_09_list_only_active_services(self):
+    def test_06_list_only_active_services(self):
         """Tests listing only the active services."""
-        self.service_attrs['active'] = True
-        self._send_create_request()
-        self.service_attrs['active'] = False
-        self._send_create_request()
-        self._send_create_request()
-        response = self.client.get(reverse('api_services'), {'active': True})
+        self._create_services(active_count=1, inactive_count=2)
+        self._auth(self.admin_user)
+        with self.assertNumQueries(2):
+            response = self.client.get(_URL_API_SERVICES, {'active': True})
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(response.data['count'], 1)
         self.assertEqual(len(response.data['results']), 1)
 
-    def test_10_list_only_inactive_services(self):
+    def test_07_list_only_inactive_services(self):
         """Tests listing only the inactive services."""
-        self.service_attrs['active'] = True
-        self._send_create_request()
-        self.service_attrs['active'] = False
-        self._send_create_request()
-        self._send_create_request()
-        response = self.client.get(reverse('api_services'), {'active': False})
+        self._create_services(active_count=1, inactive_count=2)
+        self._auth(self.admin_user)
+        with self.assertNumQueries(2):
+            response = self.client.get(_URL_API_SERVICES, {'active': False})
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(response.data['count'], 2)
         self.assertEqual(len(response.data['results']), 2)
 
-    def test_11_create_price_only_positive_integer(self):
+    def test_08_create_price_only_positive_integer(self):
         """Tests that only positive integer prices can be created."""
         self.service_attrs['price_default'] = 0
         response = self._send_create_request()
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.service_attrs['price_default'] = ''
-        response = self._send_create_request()
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.service_attrs['price_default'] = 1
-        self.service_attrs['price_small'] = -1
-        response = self._send_create_request()
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.service_attrs['price_small'] = 1
-        self.service_attrs['price_big'] = 'a'
-        response = self._send_create_request()
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # the prices are validated by the view itself, so the other cases are checked without a request each
+        sc = ServiceCreate()
+        request = Mock()
+        for invalid_prices in [{'price_default': ''}, {'price_small': -1}, {'price_big': 'a'}]:
+            with self.subTest(invalid_prices=invalid_prices):
+                request.data = {**self._SERVICE_ATTRS_TEMPLATE, **invalid_prices}
+                self.assertRaises(ValidationError, sc.create, request=request)
 
-    def test_12_update_price_only_positive_integer(self):
+    def test_09_update_price_only_positive_integer(self):
         """Tests that prices can be updated only to positive integers."""
-        self._send_create_request()
-        service = Service.objects.first()
-        response = self.client.patch(reverse('api_service_update_delete', args=(service.id,)), {'price_default': 0},
-                                     format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        response = self.client.patch(reverse('api_service_update_delete', args=(service.id,)), {'price_default': ''},
-                                     format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        response = self.client.patch(reverse('api_service_update_delete', args=(service.id,)), {'price_small': 'Z'},
-                                     format='json')
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        response = self.client.patch(reverse('api_service_update_delete', args=(service.id,)), {'price_big': -1},
+        service_id = self._create_services()[0].id
+        self._auth(self.admin_user)
+        response = self.client.patch(reverse('api_service_update_delete', args=(service_id,)), {'price_default': 0},
                                      format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        # the prices are validated by the view itself, so the other cases are checked without a request each
+        srud = ServiceRetrieveUpdateDestroy()
+        request = Mock()
+        for invalid_prices in [{'price_default': ''}, {'price_small': 'Z'}, {'price_big': -1}]:
+            with self.subTest(invalid_prices=invalid_prices):
+                request.data = invalid_prices
+                self.assertRaises(ValidationError, srud.update, request=request)
 
-    def test_13_api_view_update_price_only_positive_integer_(self):
+    def test_10_api_view_update_price_only_positive_integer_(self):
         """Tests the edge cases where the API view fails because the prices are not integers."""
-        with patch.object(ServiceRetrieveUpdateDestroy, '__init__', return_value=None):
-            srud = ServiceRetrieveUpdateDestroy()
+        srud = ServiceRetrieveUpdateDestroy()
         request = Mock()
-        request.data = {'price_default': 'a', 'price_small': 1000, 'price_big': 2000}
-        self.assertRaises(ValidationError, srud.update, request=request)
-        request.data = {'price_default': 1000, 'price_small': 'a', 'price_big': 2000}
-        self.assertRaises(ValidationError, srud.update, request=request)
-        request.data = {'price_default': 1000, 'price_small': 1000, 'price_big': 'a'}
-        self.assertRaises(ValidationError, srud.update, request=request)
+        for price_field in ['price_default', 'price_small', 'price_big']:
+            with self.subTest(price_field=price_field):
+                request.data = {'price_default': 1000, 'price_small': 1000, 'price_big': 2000, price_field: 'a'}
+                self.assertRaises(ValidationError, srud.update, request=request)
 
 
-class BookingAPITestCase(APITestCase):
+@tag('api', 'booking')
+class BookingAPITestCase(_AuthenticationMixin, APITestCase):
     """
     Test cases for APIs related to bookings.
     """
+    _BOOKING_ATTRS_TEMPLATE = {
+        'dog_size': 'big',
+        'comment': 'My dog is a Golden and I want it to have batched and its nails cut.',
+        'cancelled': False
+    }
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
+        cls.user = CustomUser.objects.create_user(username='user', password='test_password')
+        # creating a new service to be able to do a booking and the contact details for the opening hours
+        cls.service = cls._create_new_service()
+        cls.contact = Contact.objects.create(**_DEFAULT_CONTACT_ATTRS)
+        # the next open day (Sunday is closed) and the current time, formatted once for the whole class
+        time_delta = 1 if datetime.date.today().weekday() != 5 else 2
+        cls.booking_day = datetime.date.today() + datetime.timedelta(days=time_delta)
+        cls.booking_day_str = cls.booking_day.isoformat()
+        cls.booking_time_str = datetime.datetime.now().time().isoformat(timespec='seconds')
+        # counted once, the tests compare against it after creating a booking
+        cls.initial_booking_count = Booking.objects.count()
 
     def setUp(self):
-        self.client = APIClient()
-        self.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
-        self.user = CustomUser.objects.create_user(username='user', password='test_password')
-        # creating a new service to be able to do a booking
-        self.service = self._create_new_service()
-        today_weekday = datetime.date.today().weekday()
-        self.time_delta = 1 if today_weekday != 5 else 2
-        self.booking_attrs = {
+        # the tests mutate the attrs, so every test gets its own copy of the template
+        self.booking_attrs = self._BOOKING_ATTRS_TEMPLATE.copy()
+        self.booking_attrs.update({
             'user': self.user.id,
             'service': self.service.id,
-            'dog_size': 'big',
-            'date': datetime.date.strftime(datetime.date.today() + datetime.timedelta(days=self.time_delta), '%Y-%m-%d'),
-            'time': datetime.time.strftime(datetime.datetime.now().time(), '%H:%M:%S'),
-            'comment': 'My dog is a Golden and I want it to have batched and its nails cut.',
-            'cancelled': False
-        }
+            'date': self.booking_day_str,
+            'time': self.booking_time_str
+        })
 
-    def _create_new_service(self):
-        """Calls the API to create a new service. It uploads a photo too as it is required.
-        At the end the photo is deleted."""
-        self.client.force_authenticate(user=self.admin_user)
-        photo_path = os.path.join(settings.MEDIA_ROOT, 'services', 'default.jpg')
+    @classmethod
+    def _create_new_service(cls):
+        """Creates a new service directly in the database. The default photo is referenced, so no file is uploaded."""
         service_attrs = {
             'service_name_en': 'Service name EN {}'.format(Service.objects.count()),
             'service_name_hu': 'Service name HU',
@@ -335,253 +358,170 @@ class BookingAPITestCase(APITestCase):
             'service_description_en': 'Description in English for the service.',
             'service_description_hu': 'A szolgáltatás leírása magyarul.',
             'max_duration': 60,
+            'photo': 'services/default.jpg',
             'active': True
         }
-        with open(photo_path, 'rb') as photo_data:
-            service_attrs['photo'] = photo_data
-            response = self.client.post(reverse('api_service_create'), service_attrs, format='multipart')
-        try:
-            created_service = Service.objects.last()
-            os.remove(created_service.photo.path)
-            return created_service
-        except:
-            return None
-
-    def _create_contact(self):
-        """Calls the API to create the contact details."""
-        contact_attrs = {
-            'phone_number': '+36991234567',
-            'email': 'somebody@mail.com',
-            'address': 'Happiness Street 1, HappyCity, 99999',
-            'opening_hour_monday': '08:00:00',
-            'closing_hour_monday': '17:30:00',
-            'opening_hour_tuesday': '08:00:00',
-            'closing_hour_tuesday': '17:30:00',
-            'opening_hour_wednesday': '08:00:00',
-            'closing_hour_wednesday': '17:30:00',
-            'opening_hour_thursday': '08:00:00',
-            'closing_hour_thursday': '17:30:00',
-            'opening_hour_friday': '08:00:00',
-            'closing_hour_friday': '17:30:00',
-            'opening_hour_saturday': '09:00:00',
-            'closing_hour_saturday': '13:30:00',
-            'google_maps_url': 'https://www.google.com/maps/embed?pb=!1m18!1m12!1m3!1d2726.2653641484812!2d19.65391067680947!3d46.89749933667435!2m3!1f0!2f0!3f0!3m2!1i1024!2i768!4f13.1!3m3!1m2!1s0x4743d09cb06aa0cd%3A0xc162d3291067ef90!2sBennett%20Kft.%20Sz%C3%A9kt%C3%B3i%20kutyaszalon!5e0!3m2!1sen!2ses!4v1696190559457!5m2!1sen!2ses'
-        }
-        self.client.force_authenticate(user=self.admin_user)
-        return self.client.post(reverse('api_contact_create'), contact_attrs)
+        return Service.objects.create(**service_attrs)
 
-    def _send_create_request(self, admin=True):
+    def _send_create_request(self):
         """Calls the API to create the contact details."""
-        self.client.force_authenticate(user=self.admin_user if admin else self.user)
-        return self.client.post(reverse('api_booking_create'), self.booking_attrs)
+        self._auth(self.admin_user)
+        return self.client.post(_URL_API_BOOKING_CREATE, self.booking_attrs)
+
+    def _get_booking_attrs(self, **attrs):
+        """Returns the attributes of a booking on the booking day, updated with the given ones."""
+        return {**self._BOOKING_ATTRS_TEMPLATE, 'user': self.user, 'service': self.service,
+                'service_price': self.service.price_default, 'date': self.booking_day, 'time': self.booking_time_str,
+                **attrs}
+
+    def _create_booking(self, **attrs):
+        """Creates a booking directly in the database, for the tests that do not test the creation itself."""
+        return Booking.objects.create(**self._get_booking_attrs(**attrs))
 
     def test_01_create_booking_without_permission(self):
         """Tries to create a booking without permission."""
-        response = self._send_create_request(admin=False)
+        response = self._call_view(BookingCreate, 'post', self.booking_attrs)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_02_create_booking(self):
         """Tests creating a booking."""
-        initial_count = Booking.objects.count()
         response = self._send_create_request()
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertEqual(Booking.objects.count(), initial_count + 1)
+        self.assertEqual(Booking.objects.count(), self.initial_booking_count + 1)
         for attr, expected_value in self.booking_attrs.items():
             self.assertEqual(response.data[attr], expected_value)
 
     def test_03_list_bookings_without_permission(self):
         """Tries to list the bookings (using the API) without permission."""
-        self._send_create_request()
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(reverse('api_bookings'))
+        response = self._call_view(BookingList)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-    def test_04_list_bookings(self):
-        """Tests listing the bookings, using the API."""
-        self._send_create_request()
-        bookings_count = Booking.objects.count()
-        response = self.client.get(reverse('api_bookings'))
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], bookings_count)
-        self.assertEqual(len(response.data['results']), bookings_count)
-
-    def test_05_list_only_active_bookings(self):
-        """Tests listing only the active bookings."""
-        self._send_create_request()
-        bookings_count = Booking.objects.count()
-        self.booking_attrs['date'] = datetime.datetime.strptime('2000-01-01', '%Y-%m-%d')
-        self._send_create_request()
-        response = self.client.get(reverse('api_bookings'), {'active': True})
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], bookings_count)
-        self.assertEqual(len(response.data['results']), bookings_count)
-
-    def test_06_list_only_cancelled_bookings(self):
-        """Tests listing only the cancelled bookings."""
-        self.booking_attrs['cancelled'] = True
-        self._send_create_request()
-        bookings_count = Booking.objects.count()
-        self.booking_attrs['cancelled'] = False
-        self._send_create_request()
-        response = self.client.get(reverse('api_bookings'), {'cancelled': True})
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], bookings_count)
-        self.assertEqual(len(response.data['results']), bookings_count)
-
-    def test_07_list_only_active_and_not_cancelled_bookings(self):
-        """Tests listing only the active and not cancelled bookings."""
-        self.booking_attrs['cancelled'] = False
-        self.booking_attrs['date'] = datetime.date.today() + datetime.timedelta(days=self.time_delta)
-        self._send_create_request()
-        bookings_count = Booking.objects.count()
-        self.booking_attrs['cancelled'] = True
-        self._send_create_request()
-        self.booking_attrs['date'] = datetime.datetime.strptime('2000-01-01', '%Y-%m-%d')
-        self._send_create_request()
-        response = self.client.get(reverse('api_bookings'), {'active': True, 'cancelled': False})
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], bookings_count)
-        self.assertEqual(len(response.data['results']), bookings_count)
-
-    def test_08_list_bookings_with_no_filters(self):
-        """Tests listing the bookings with no filters."""
-        self.booking_attrs['cancelled'] = False
-        self.booking_attrs['date'] = datetime.date.today() + datetime.timedelta(days=self.time_delta)
-        self._send_create_request()
-        self.booking_attrs['cancelled'] = True
-        self._send_create_request()
-        self.booking_attrs['date'] = datetime.datetime.strptime('2000-01-01', '%Y-%m-%d')
-        self._send_create_request()
-        bookings_count = Booking.objects.count()
-        response = self.client.get(reverse('api_bookings'), {'active': False})
-        self.assertIsNone(response.data['next'])
-        self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], bookings_count)
-        self.assertEqual(len(response.data['results']), bookings_count)
-
-    def test_09_cancel_booking(self):
+    def test_04_list_bookings_with_filters(self):
+        """Tests listing the bookings with the different filters, using the API."""
+        # one booking for each combination of the filters, created directly as only the listing is tested here
+        Booking.objects.bulk_create([Booking(**self._get_booking_attrs(date=date, cancelled=cancelled))
+                                     for date in (self.booking_day, _PAST_DATE) for cancelled in (False, True)])
+        self._auth(self.admin_user)
+        # without the active filter only the future bookings are listed
+        for query_params, expected_count in [({}, 2),
+                                             ({'active': True}, 2),
+                                             ({'cancelled': True}, 1),
+                                             ({'active': True, 'cancelled': False}, 1),
+                                             ({'active': False}, 4)]:
+            with self.subTest(query_params=query_params):
+                # one query counts the records and one fetches the page, however many records there are
+                with self.assertNumQueries(2):
+                    response = self.client.get(_URL_API_BOOKINGS, query_params)
+                self.assertIsNone(response.data['next'])
+                self.assertIsNone(response.data['previous'])
+                self.assertEqual(response.data['count'], expected_count)
+                self.assertEqual(len(response.data['results']), expected_count)
+
+    def test_05_cancel_booking(self):
         """Tests cancelling a booking."""
-        self.booking_attrs['cancelled'] = False
-        self.booking_attrs['date'] = datetime.date.today() + datetime.timedelta(days=self.time_delta)
-        self._send_create_request()
-        booking = Booking.objects.last()
+        booking = self._create_booking()
         original_cancelled = booking.cancelled
-        self.client.logout()
-        self.client.force_authenticate(user=self.user)
+        self._auth(self.user)
         response = self.client.get(reverse('api_cancel_booking', args=(booking.id,)))
         cancelled_booking = Booking.objects.get(id=booking.id)
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
         self.assertNotEquals(original_cancelled, cancelled_booking.cancelled)
 
-    def test_10_list_available_booking_slots(self):
+    def test_06_list_available_booking_slots(self):
         """Tests listing the available booking slots for a given day."""
-        self._create_contact()
-        response = self.client.get(reverse('api_available_booking_slots'),
-                                   {'day': datetime.date.strftime(datetime.date.today() + datetime.timedelta(days=self.time_delta),
-                                                                  '%Y-%m-%d'),
+        response = self.client.get(_URL_API_AVAILABLE_BOOKING_SLOTS,
+                                   {'day': self.booking_day_str,
                                     'service_id': self.service.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_data = response.json()
         self.assertIn(['12:00', '12:00 - 13:00'], response_data.get('booking_slots'))
-        self.booking_attrs['time'] = '12:00:00'
-        self._send_create_request()
-        response = self.client.get(reverse('api_available_booking_slots'),
-                                   {'day': datetime.date.strftime(datetime.date.today() + datetime.timedelta(days=self.time_delta),
-                                                                  '%Y-%m-%d'),
+        self._create_booking(time='12:00:00')
+        response = self.client.get(_URL_API_AVAILABLE_BOOKING_SLOTS,
+                                   {'day': self.booking_day_str,
                                     'service_id': self.service.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_data = response.json()
         self.assertNotIn(['12:00', '12:00 - 13:00'], response_data.get('booking_slots'))
 
-    def test_11_booking_slots_for_closed_day(self):
+    def test_07_booking_slots_for_closed_day(self):
         """Tests listing the available booking slots for a closed day."""
-        self._create_contact()
         today_weekday = datetime.date.today().weekday() + 1
         delta_to_sunday = (7 - today_weekday) % 7
-        response = self.client.get(reverse('api_available_booking_slots'),
-                                   {'day': datetime.date.strftime(datetime.date.today() +
-                                                                  datetime.timedelta(days=delta_to_sunday),
-                                                                  '%Y-%m-%d'),
+        sunday = datetime.date.today() + datetime.timedelta(days=delta_to_sunday)
+        response = self.client.get(_URL_API_AVAILABLE_BOOKING_SLOTS,
+                                   {'day': sunday.isoformat(),
                                     'service_id': self.service.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         response_data = response.json()
         self.assertIn(['', 'Closed'], response_data.get('booking_slots'))
 
-    def test_12_cancel_booking_with_string_booking_id(self):
+    def test_08_cancel_booking_with_string_booking_id(self):
         """Tests that cancelling a booking fails with bad request when a string booking id value provided."""
-        with patch.object(CancelBooking, '__init__', return_value=None):
-            cb = CancelBooking()
-            cb.kwargs = {'booking_id': 'a'}
-            response = cb.get(request=None)
+        cb = CancelBooking(kwargs={'booking_id': 'a'})
+        response = cb.get(request=None)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    def test_13_cancel_booking_with_cancel_function_failing(self):
+    def test_09_cancel_booking_with_cancel_function_failing(self):
         """Tests cancelling a booking when the cancel function fails and a response with HTTP code 500 is returned."""
-        self._send_create_request()
-        with patch.object(CancelBooking, '__init__', return_value=None):
-            with patch.object(Booking, 'cancel_booking', return_value=False):
-                booking_id = Booking.objects.last().id
-                cb = CancelBooking()
-                cb.kwargs = {'booking_id': booking_id}
-                request = Mock()
-                request.query_params = {}
-                response = cb.get(request=request)
+        booking_id = self._create_booking().id
+        cb = CancelBooking(kwargs={'booking_id': booking_id})
+        request = Mock()
+        request.query_params = {}
+        with patch.object(Booking, 'cancel_booking', return_value=False):
+            response = cb.get(request=request)
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertIn('An error happened during the cancellation of the booking', response.data.get('message'))
 
-    def test_14_cancel_booking_with_booking_not_exist_failing(self):
+    def test_10_cancel_booking_with_booking_not_exist_failing(self):
         """Tests cancelling a booking when the booking does not exist and a response with HTTP code 500 is returned."""
-        with patch.object(CancelBooking, '__init__', return_value=None):
-            with patch.object(Booking.objects, 'get', side_effect=Booking.DoesNotExist):
-                cb = CancelBooking()
-                cb.kwargs = {'booking_id': 1}
-                request = Mock()
-                request.query_params = {}
-                response = cb.get(request=request)
+        cb = CancelBooking(kwargs={'booking_id': 1})
+        request = Mock()
+        request.query_params = {}
+        with patch.object(Booking.objects, 'get', side_effect=Booking.DoesNotExist):
+            response = cb.get(request=request)
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertEqual('Booking with booking ID 1 does not exist', response.data.get('message'))
 
-    def test_15_list_available_time_slots_with_missing_params(self):
+    def test_11_list_available_time_slots_with_missing_params(self):
         """Tests listing the available booking slots when parameters are not received and fails with a bad request."""
-        with patch.object(ListAvailableBookingSlots, '__init__', return_value=None):
-            labs = ListAvailableBookingSlots()
+        labs = ListAvailableBookingSlots()
         request = Mock()
-        request.query_params = {}
-        response = labs.get(request=request)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        request.query_params = {'day': '2023-01-01'}
-        response = labs.get(request=request)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        request.query_params = {'service_id': 1}
-        response = labs.get(request=request)
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for query_params in [{}, {'day': '2023-01-01'}, {'service_id': 1}]:
+            with self.subTest(query_params=query_params):
+                request.query_params = query_params
+                response = labs.get(request=request)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
-class UserAPITestCase(APITestCase):
+@tag('api', 'user')
+class UserAPITestCase(_AuthenticationMixin, APITestCase):
     """
     Test cases for APIs related to users.
     """
 
-    def setUp(self):
-        self.client = APIClient()
-        self.admin_user = CustomUser.objects.create_superuser(username='admin', password='admin_password')
-        self.user = CustomUser.objects.create_user(username='user', password='test_password')
+    @classmethod
+    def setUpTestData(cls):
+        # the users never log in, they are authenticated by force, so all of them are created with a single query and
+        # an unusable password, nothing has to be hashed
+        cls.admin_user, cls.user, cls.inactive_user = CustomUser.objects.bulk_create([
+            CustomUser(username='admin', password=make_password(None), is_staff=True, is_superuser=True),
+            CustomUser(username='user', password=make_password(None)),
+            CustomUser(username='inactive_user', password=make_password(None), is_active=False)
+        ])
 
     def test_01_list_users_without_permission(self):
         """Tries to list the users (using the API) without permission."""
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(reverse('api_users'))
+        response = self._call_view(UserList)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_02_list_users(self):
         """Tests listing the users, using the API."""
-        self.client.force_authenticate(user=self.admin_user)
+        self._auth(self.admin_user)
         users_count = CustomUser.objects.count()
-        response = self.client.get(reverse('api_users'))
+        # one query counts the users, one fetches the page and one prefetches each of the groups and the permissions,
+        # however many users there are
+        with self.assertNumQueries(4):
+            response = self.client.get(_URL_API_USERS)
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(response.data['count'], users_count)
@@ -589,22 +529,19 @@ class UserAPITestCase(APITestCase):
 
     def test_03_list_only_active_users(self):
         """Tests listing only the active users."""
-        self.client.force_authenticate(user=self.admin_user)
-        users_count = CustomUser.objects.count()
-        inactive_user = CustomUser.objects.create_user(username='inactive_user', password='test_password',
-                                                       is_active=False)
-        response = self.client.get(reverse('api_users'), {'active': True})
+        self._auth(self.admin_user)
+        with self.assertNumQueries(4):
+            response = self.client.get(_URL_API_USERS, {'active': True})
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
-        self.assertEqual(response.data['count'], users_count)
-        self.assertEqual(len(response.data['results']), users_count)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 2)
 
     def test_04_list_only_not_active_users(self):
         """Tests listing only the not active users."""
-        self.client.force_authenticate(user=self.admin_user)
-        inactive_user = CustomUser.objects.create_user(username='inactive_user', password='test_password',
-                                                       is_active=False)
-        response = self.client.get(reverse('api_users'), {'active': False})
+        self._auth(self.admin_user)
+        with self.assertNumQueries(4):
+            response = self.client.get(_URL_API_USERS, {'active': False})
         self.assertIsNone(response.data['next'])
         self.assertIsNone(response.data['previous'])
         self.assertEqual(response.data['count'], 1)
@@ -612,15 +549,13 @@ class UserAPITestCase(APITestCase):
 
     def test_05_cancel_user_without_permission(self):
         """Tests cancelling a user without permission."""
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(reverse('api_cancel_user', args=(self.user.id,)), follow=True)
+        response = self._call_view(CancelUser, user_id=self.user.id)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_06_cancel_user(self):
         """Tests cancelling a user."""
         original_is_active = self.user.is_active
-        self.client.logout()
-        self.client.force_authenticate(user=self.admin_user)
+        self._auth(self.admin_user)
         response = self.client.get(reverse('api_cancel_user', args=(self.user.id,)))
         cancelled_user = CustomUser.objects.get(id=self.user.id)
         self.assertEqual(response.status_code, status.HTTP_302_FOUND)
@@ -628,33 +563,26 @@ class UserAPITestCase(APITestCase):
 
     def test_07_cancel_user_with_string_user_id(self):
         """Tests that cancelling a user fails with bad request when a string user id value provided."""
-        with patch.object(CancelUser, '__init__', return_value=None):
-            cu = CancelUser()
-            cu.kwargs = {'user_id': 'a'}
-            response = cu.get(request=None)
+        cu = CancelUser(kwargs={'user_id': 'a'})
+        response = cu.get(request=None)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_08_cancel_user_with_cancel_function_failing(self):
         """Tests cancelling a user when the cancel function fails and a response with HTTP code 500 is returned."""
-        with patch.object(CancelUser, '__init__', return_value=None):
-            with patch.object(CustomUser, 'cancel_user', return_value=False):
-                user_id = CustomUser.objects.last().id
-                cu = CancelUser()
-                cu.kwargs = {'user_id': user_id}
-                request = Mock()
-                request.query_params = {}
-                response = cu.get(request=request)
+        cu = CancelUser(kwargs={'user_id': self.user.id})
+        request = Mock()
+        request.query_params = {}
+        with patch.object(CustomUser, 'cancel_user', return_value=False):
+            response = cu.get(request=request)
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertIn('An error happened during the cancellation of the user', response.data.get('message'))
 
     def test_09_cancel_user_with_user_not_exist_failing(self):
         """Tests cancelling a user when the user does not exist and a response with HTTP code 500 is returned."""
-        with patch.object(CancelUser, '__init__', return_value=None):
-            with patch.object(CustomUser.objects, 'get', side_effect=CustomUser.DoesNotExist):
-                cu = CancelUser()
-                cu.kwargs = {'user_id': 1}
-                request = Mock()
-                request.query_params = {}
-                response = cu.get(request=request)
+        cu = CancelUser(kwargs={'user_id': 1})
+        request = Mock()
+        request.query_params = {}
+        with patch.object(CustomUser.objects, 'get', side_effect=CustomUser.DoesNotExist):
+            response = cu.get(request=request)
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
         self.assertEqual('User with user ID 1 does not exist', response.data.get('message'))
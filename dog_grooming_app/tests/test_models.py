@@ -1,5 +1,5 @@
 from django.core.exceptions import ValidationError as django_ValidationError
-from django.test import TestCase, Client
+from django.test import TestCase
 from django.urls import reverse
 from django.db.utils import Error
 from django.db import models
@@ -70,39 +70,35 @@ class ActivateAccountTestCase(TestCase):
     Test cases for the user account activation.
     """
 
-    def setUp(self):
-        self.client = Client()
-        self.user = CustomUser.objects.create_user(username='user', password='test_password')
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = CustomUser.objects.create_user(username='user', password='test_password')
+        # the uid and the token of the user are computed once, the tests only send them in different combinations
+        cls.uid = urlsafe_base64_encode(force_bytes(cls.user.pk))
+        cls.token = account_activation_token.make_token(cls.user)
+        another_user = CustomUser.objects.create_user(username='another_user', password='test_password')
+        cls.another_uid = urlsafe_base64_encode(force_bytes(another_user.pk))
 
     def test_01_activate_user_account_successful(self):
         """Tests the successful activation of a user account."""
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
-        token = account_activation_token.make_token(self.user)
-        response = self.client.post(reverse('activate_account', args=(uid, token)), follow=True)
+        response = self.client.post(reverse('activate_account', args=(self.uid, self.token)), follow=True)
         self.assertContains(response, '<div class="form_success_message">')
         self.assertContains(response, 'Your account has been activated successfully, you can log in now.')
 
     def test_02_activate_user_account_not_successful(self):
         """Tests when activating the user account fails because of an invalid uid."""
-        uid = 'aaa'
-        token = account_activation_token.make_token(self.user)
-        response = self.client.post(reverse('activate_account', args=(uid, token)), follow=True)
+        response = self.client.post(reverse('activate_account', args=('aaa', self.token)), follow=True)
         self.assertContains(response, '<div class="login_signup_errors">')
         self.assertContains(response, 'Activation link is invalid or there was a problem activating your account.')
 
     def test_03_activate_user_account_not_successful(self):
         """Tests when activating the user account fails because of an invalid token."""
-        uid = urlsafe_base64_encode(force_bytes(self.user.pk))
-        token = 'aaa'
-        response = self.client.post(reverse('activate_account', args=(uid, token)), follow=True)
+        response = self.client.post(reverse('activate_account', args=(self.uid, 'aaa')), follow=True)
         self.assertContains(response, '<div class="login_signup_errors">')
         self.assertContains(response, 'Activation link is invalid or there was a problem activating your account.')
 
     def test_04_activate_user_account_not_successful(self):
         """Tests when activating the user account fails because a different user's pk was used in the decoding."""
-        uid = urlsafe_base64_encode(force_bytes(CustomUser.objects.create_user(username='another_user',
-                                                                               password='test_password').pk))
-        token = account_activation_token.make_token(self.user)
-        response = self.client.post(reverse('activate_account', args=(uid, token)), follow=True)
+        response = self.client.post(reverse('activate_account', args=(self.another_uid, self.token)), follow=True)
         self.assertContains(response, '<div class="login_signup_errors">')
         self.assertContains(response, 'Activation link is invalid or there was a problem activating your account.')
@@ -345,7 +345,7 @@ class UserBookingsPage(LoginRequiredMixin, TemplateView):
         booking_filter = Q(cancelled=False) & Q(user=self.request.user.id) & \
                           (Q(date__gt=datetime.date.today()) |
                            (Q(date=datetime.date.today()) & Q(time__gt=datetime.datetime.now().time())))
-        bookings = Booking.objects.filter(booking_filter).order_by('date', 'time')
+        bookings = Booking.objects.filter(booking_filter).select_related('service').order_by('date', 'time')
 
         page_number = int(self.request.GET.get('page', 1))
         paginator = Paginator(bookings, BOOKINGS_PER_PAGE)
@@ -413,7 +413,7 @@ class AdminBookingsPage(LoginRequiredMixin, TemplateView):
         if user_filter:
                 booking_filter = booking_filter & user_filter
 
-        bookings = Booking.objects.filter(booking_filter).order_by('date', 'time')
+        bookings = Booking.objects.filter(booking_filter).select_related('service', 'user').order_by('date', 'time')
         page_number = int(self.request.GET.get('page', 1))
         paginator = Paginator(bookings, BOOKINGS_PER_PAGE)
         page = paginator.get_page(page_number)
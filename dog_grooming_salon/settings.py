@@ -19,6 +19,8 @@ import logging.config
 
 # Whether the tests are being run
 TEST_MODE = len(sys.argv) > 1 and sys.argv[1] == 'test'
+# Local opt-in to create the test database directly from the models, the CI always runs the migrations
+TEST_WITHOUT_MIGRATIONS = TEST_MODE and os.environ.get('TEST_WITHOUT_MIGRATIONS', '').lower() in ('1', 'true')
 
 from .utils import load_config
 
@@ -121,6 +123,29 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# The tests create lots of users, the fast but insecure MD5 hasher is used for them
+if TEST_MODE:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+
+class DisableMigrations:
+    """
+    Used as MIGRATION_MODULES when running the tests with TEST_WITHOUT_MIGRATIONS, so that the test database is created
+    directly from the models instead of replaying all the migrations.
+    """
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+if TEST_WITHOUT_MIGRATIONS:
+    MIGRATION_MODULES = DisableMigrations()
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/4.2/topics/i18n/
@@ -176,6 +201,17 @@ LANGUAGES = (
 MEDIA_ROOT = os.path.abspath(os.path.join(BASE_DIR, 'dog_grooming_app', 'media'))
 MEDIA_URL = '/media/'
 
+# The files uploaded by the tests are kept in memory, nothing is written into the media folder
+if TEST_MODE:
+    STORAGES = {
+        'default': {
+            'BACKEND': 'django.core.files.storage.InMemoryStorage',
+        },
+        'staticfiles': {
+            'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+        },
+    }
+
 
 # logging
 
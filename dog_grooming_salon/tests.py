@@ -1,4 +1,3 @@
-import os
 import unittest
 from unittest.mock import mock_open, patch, Mock
 from django.test import TestCase